@@ -4,6 +4,7 @@ from config import Config
 from routes.upload_routes import upload_bp
 from routes.processing_routes import processing_bp
 from routes.template_routes import template_bp
+from utils.compression import init_compression
 
 def create_app():
     app = Flask(__name__)
@@ -12,6 +13,9 @@ def create_app():
     # Initialize configuration
     Config.init_app(app)
     
+    # Negotiate gzip/zstd for request and response bodies
+    init_compression(app)
+    
     # Register blueprints
     app.register_blueprint(upload_bp)
     app.register_blueprint(processing_bp)
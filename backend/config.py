@@ -8,8 +8,35 @@ class Config:
     DATA_DIR = 'data'
     GEMINI_API_KEY = os.getenv('GEMINI_API_KEY')
     
+    # Response compression (gzip/zstd) for bodies at least this many bytes
+    COMPRESSION_MIN_SIZE = int(os.getenv('COMPRESSION_MIN_SIZE', 1024))
+    GZIP_LEVEL = int(os.getenv('GZIP_LEVEL', 6))
+    ZSTD_LEVEL = int(os.getenv('ZSTD_LEVEL', 3))
+    # Upper bound for gzip/zstd encoded request bodies once decoded
+    MAX_DECOMPRESSED_SIZE = int(os.getenv('MAX_DECOMPRESSED_SIZE', 50 * 1024 * 1024))
+    
+    # Storage backend: 'local' filesystem or 's3' (any S3-compatible store, e.g. MinIO)
+    STORAGE_BACKEND = os.getenv('STORAGE_BACKEND', 'local')
+    S3_BUCKET = os.getenv('S3_BUCKET')
+    S3_PREFIX = os.getenv('S3_PREFIX', '')
+    S3_ENDPOINT_URL = os.getenv('S3_ENDPOINT_URL')
+    
+    # Cache and lock backend: 'local' (in-process) or 'redis' (shared by all replicas)
+    CACHE_BACKEND = os.getenv('CACHE_BACKEND', 'local')
+    REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+    CACHE_PREFIX = os.getenv('CACHE_PREFIX', 'clean-data:')
+    # Short enough to only coalesce concurrent AI requests; re-runs get a fresh response
+    AI_CACHE_TTL = int(os.getenv('AI_CACHE_TTL', 60))
+    # Maximum number of entries kept by the in-process cache
+    LOCAL_CACHE_MAX_ENTRIES = int(os.getenv('LOCAL_CACHE_MAX_ENTRIES', 256))
+    # Locks expire after LOCK_TIMEOUT seconds; waiters give up after LOCK_WAIT_TIMEOUT
+    LOCK_TIMEOUT = float(os.getenv('LOCK_TIMEOUT', 300))
+    LOCK_WAIT_TIMEOUT = float(os.getenv('LOCK_WAIT_TIMEOUT', 300))
+    LOCK_POLL_INTERVAL = float(os.getenv('LOCK_POLL_INTERVAL', 0.2))
+    
     @staticmethod
     def init_app(app):
-        # Ensure directories exist
-        os.makedirs(Config.UPLOAD_FOLDER, exist_ok=True)
-        os.makedirs(Config.DATA_DIR, exist_ok=True)
+        # Ensure directories exist for local storage
+        if Config.STORAGE_BACKEND == 'local':
+            os.makedirs(Config.UPLOAD_FOLDER, exist_ok=True)
+            os.makedirs(Config.DATA_DIR, exist_ok=True)
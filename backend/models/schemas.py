@@ -11,13 +11,19 @@ class UploadResponse:
 class ExtractionResponse:
     message: str
     file_url: str
-    text: str
+    document_id: str
+    page_count: int
+    char_count: int
+    text: Optional[str] = None
     error: Optional[str] = None
 
 @dataclass
 class AIProcessingRequest:
     user_prompt: str
-    extracted_text: str
+    extracted_text: Optional[str] = None
+    document_id: Optional[str] = None
+    page_start: Optional[int] = None
+    page_end: Optional[int] = None
     user_api_key: Optional[str] = None
     ai_provider: str = 'gemini'
 
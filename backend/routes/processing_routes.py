@@ -1,33 +1,49 @@
 import os
 import json
+import hashlib
 from flask import Blueprint, request, jsonify
 from config import Config
 from services.pdf_service import PDFService
 from services.ai_service import AIService
 from services.file_service import FileService
+from services.cache_service import get_cache
+from services.storage_service import storage_key
+from utils.validators import validate_page_range, validate_document_id, is_true_flag
 
 processing_bp = Blueprint('processing', __name__)
 
 @processing_bp.route('/extract-text', methods=['POST'])
 def extract_text():
     """Extract text from uploaded PDF"""
-    pdf_file = os.path.join(Config.UPLOAD_FOLDER, 'uploaded_file.pdf')
+    options = request.get_json(silent=True) or {}
+    document_id = options.get('document_id') or request.args.get('document_id')
+    metadata_only = is_true_flag(options.get('metadata_only')) or is_true_flag(request.args.get('metadata_only'))
+    
+    is_valid, message = validate_document_id(document_id)
+    if not is_valid:
+        return jsonify({'error': message}), 400
     
     try:
-        # Extract text from PDF
-        text = PDFService.extract_text_from_pdf(pdf_file)
-        
-        # Save extracted text
-        text_file_path = PDFService.save_extracted_text(text)
+        # Extract text from PDF, reusing the stored pages if another request already did
+        pages = PDFService.extract_document(document_id)
+        text = ''.join(pages)
         
-        return jsonify({
+        response = {
             'message': 'Text extracted successfully', 
-            'file_url': text_file_path, 
-            'text': text
-        }), 200
+            'file_url': storage_key(Config.DATA_DIR, PDFService.extracted_text_filename(document_id)), 
+            'document_id': document_id,
+            'page_count': len(pages),
+            'char_count': len(text)
+        }
+        if not metadata_only:
+            response['text'] = text
+        
+        return jsonify(response), 200
         
     except FileNotFoundError:
         return jsonify({'error': 'No PDF file found to extract text from'}), 404
+    except TimeoutError:
+        return jsonify({'error': 'This document is still being extracted. Please try again shortly'}), 503
     except Exception as e:
         return jsonify({'error': f'Error extracting text: {str(e)}'}), 500
 
@@ -38,10 +54,27 @@ def clean_with_ai():
     user_api_key = request.json.get('user_api_key') or os.getenv('GEMINI_API_KEY')
     user_prompt = request.json.get('user_prompt')
     extracted_text = request.json.get('extracted_text')
+    document_id = request.json.get('document_id')
     ai_provider = request.json.get('ai_provider', 'gemini')
+    no_cache = is_true_flag(request.json.get('no_cache'))
+
+    # Resolve a server-side text reference when no inline text is sent
+    if not extracted_text and document_id:
+        page_start = request.json.get('page_start')
+        page_end = request.json.get('page_end')
+        is_valid, message = validate_page_range(page_start, page_end)
+        if not is_valid:
+            return jsonify({'error': message}), 400
+        
+        try:
+            extracted_text = PDFService.load_document_text(document_id, page_start, page_end)
+        except FileNotFoundError:
+            return jsonify({'error': 'Document not found. Extract the text again to create a new reference'}), 404
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
 
     if not user_prompt or not extracted_text:
-        return jsonify({'error': 'Missing required fields: user_prompt and extracted_text'}), 400
+        return jsonify({'error': 'Missing required fields: user_prompt and extracted_text or document_id'}), 400
     
     if not user_api_key:
         return jsonify({'error': 'API key is required. Please provide user_api_key in request or set GEMINI_API_KEY environment variable'}), 400
@@ -52,26 +85,40 @@ def clean_with_ai():
             {extracted_text}
             """
 
+    # Process the text with the selected AI provider
+    if ai_provider == 'google':
+        process = AIService.process_with_gemini
+    elif ai_provider == 'openai':
+        process = AIService.process_with_openai
+    else:
+        return jsonify({'error': 'Invalid AI provider specified'}), 400
+
+    # Identical prompts with the same API key are sent to the AI provider
+    # once across all replicas; no_cache forces a fresh response
+    key_hash = hashlib.sha256(user_api_key.encode('utf-8')).hexdigest()[:32]
+    prompt_hash = hashlib.sha256(f'{ai_provider}\n{prompt}'.encode('utf-8')).hexdigest()
+    cache_key = f'ai:{key_hash}:{prompt_hash}'
+
+    def run_ai():
+        content = process(user_api_key, prompt)
+        # Validate before caching so a bad response is never shared
+        parsed = json.loads(content)
+        # Save parsed JSON data to file, keyed like the cache entry
+        FileService.save_json_data(parsed, f'cleaned_data_{key_hash}_{prompt_hash[:32]}.json')
+        return content
+
     try:
-        # Process the text with the selected AI provider
-        if ai_provider == 'google':
-            content = AIService.process_with_gemini(user_api_key, prompt)
-        elif ai_provider == 'openai':
-            content = AIService.process_with_openai(user_api_key, prompt)
-        else:
-            return jsonify({'error': 'Invalid AI provider specified'}), 400
+        content = get_cache().single_flight(cache_key, run_ai, Config.AI_CACHE_TTL, refresh=no_cache)
         
         # Convert AI response string to Python object
-        try:
-            content = json.loads(content)
-        except json.JSONDecodeError:
-            return jsonify({'error': 'AI response is not valid JSON'}), 500
-
-        # Save parsed JSON data to file
-        FileService.save_json_data(content, 'cleaned_data.json')
+        content = json.loads(content)
 
         return jsonify({'message': 'Data cleaned successfully', 'content': content}), 200
         
+    except json.JSONDecodeError:
+        return jsonify({'error': 'AI response is not valid JSON'}), 500
+    except TimeoutError:
+        return jsonify({'error': 'This text is still being processed. Please try again shortly'}), 503
     except ValueError as e:
         # Handle API key validation errors
         if "API key" in str(e):
@@ -1,7 +1,9 @@
-import os
-from flask import Blueprint, request, jsonify, send_from_directory
+from io import BytesIO
+from flask import Blueprint, request, jsonify, send_file
 from config import Config
 from services.file_service import FileService
+from services.pdf_service import PDFService
+from utils.validators import validate_document_id
 
 upload_bp = Blueprint('upload', __name__)
 
@@ -17,23 +19,35 @@ def upload_file():
         return jsonify({'error': 'No selected file'}), 400
     
     if file and file.filename.endswith('.pdf'):
-        pdf_path = os.path.join(Config.UPLOAD_FOLDER, "uploaded_file.pdf")
-        file.save(pdf_path)
-        return jsonify({'message': 'File uploaded successfully', 'file_path': pdf_path}), 200
+        # Key uploads by content so concurrent users never overwrite each other
+        pdf_data = file.read()
+        document_id = PDFService.get_document_id(pdf_data)
+        pdf_path = FileService.save_file(Config.UPLOAD_FOLDER, f'{document_id}.pdf', pdf_data)
+        return jsonify({'message': 'File uploaded successfully', 'file_path': pdf_path, 'document_id': document_id}), 200
     
     return jsonify({'error': 'Invalid file format. Only PDF files are allowed.'}), 400
 
 @upload_bp.route('/download-pdf-file', methods=['GET'])
 def download_uploaded_file():
     """Download uploaded PDF file"""
-    if not FileService.file_exists(Config.UPLOAD_FOLDER, 'uploaded_file.pdf'):
+    document_id = request.args.get('document_id')
+    is_valid, message = validate_document_id(document_id)
+    if not is_valid:
+        return jsonify({'error': message}), 400
+    
+    if not FileService.file_exists(Config.UPLOAD_FOLDER, f'{document_id}.pdf'):
         return jsonify({'error': 'No PDF file found'}), 404
-    return send_from_directory(Config.UPLOAD_FOLDER, 'uploaded_file.pdf', as_attachment=True)
+    pdf_data = FileService.read_file(Config.UPLOAD_FOLDER, f'{document_id}.pdf')
+    return send_file(BytesIO(pdf_data), mimetype='application/pdf', as_attachment=True, download_name=f'{document_id}.pdf')
 
 @upload_bp.route('/uploaded-file-url', methods=['GET'])
 def get_uploaded_file_url():
     """Get uploaded file URL"""
-    pdf_file = os.path.join(Config.UPLOAD_FOLDER, 'uploaded_file.pdf')
-    if not os.path.exists(pdf_file):
-        return None
-    return jsonify({'file_url': pdf_file}), 200
+    document_id = request.args.get('document_id')
+    is_valid, message = validate_document_id(document_id)
+    if not is_valid:
+        return jsonify({'error': message}), 400
+    
+    if not FileService.file_exists(Config.UPLOAD_FOLDER, f'{document_id}.pdf'):
+        return jsonify({'error': 'No PDF file found'}), 404
+    return jsonify({'file_url': PDFService.upload_path(document_id)}), 200
@@ -0,0 +1,179 @@
+import time
+import uuid
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from config import Config
+
+class CacheBackend:
+    """String cache with named locks, used to de-duplicate work across requests"""
+
+    def get(self, key):
+        """Return the cached string for key, or None"""
+        raise NotImplementedError
+
+    def set(self, key, value, ttl=None):
+        """Cache a string value, expiring after ttl seconds if given"""
+        raise NotImplementedError
+
+    def acquire_lock(self, name, timeout):
+        """Try to take the lock once; return a release token, or None if it is held"""
+        raise NotImplementedError
+
+    def release_lock(self, name, token):
+        """Release the lock if it is still held with token"""
+        raise NotImplementedError
+
+    @contextmanager
+    def lock(self, name, timeout=None, wait=None):
+        """Hold a named lock, waiting up to wait seconds for it.
+
+        The lock expires after timeout seconds so a crashed holder cannot block
+        other replicas forever.
+        """
+        timeout = timeout or Config.LOCK_TIMEOUT
+        wait = Config.LOCK_WAIT_TIMEOUT if wait is None else wait
+        deadline = time.monotonic() + wait
+        token = self.acquire_lock(name, timeout)
+        while token is None:
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Timed out waiting for lock: {name}")
+            time.sleep(Config.LOCK_POLL_INTERVAL)
+            token = self.acquire_lock(name, timeout)
+        try:
+            yield
+        finally:
+            self.release_lock(name, token)
+
+    def single_flight(self, key, compute, ttl=None, refresh=False):
+        """Return the cached value for key, computing it at most once across replicas.
+
+        Concurrent callers wait for the lock holder and then read its result
+        from the cache instead of calling compute themselves. With refresh,
+        any cached value is ignored and replaced by a fresh one.
+        """
+        value = None if refresh else self.get(key)
+        if value is not None:
+            return value
+
+        with self.lock(f'lock:{key}'):
+            value = None if refresh else self.get(key)
+            if value is None:
+                value = compute()
+                self.set(key, value, ttl)
+        return value
+
+
+class LocalCache(CacheBackend):
+    """In-process cache and locks, for single-replica deployments.
+
+    Holds at most max_entries values, evicting expired and then least
+    recently used entries first.
+    """
+
+    def __init__(self, max_entries=None):
+        self.max_entries = max_entries or Config.LOCAL_CACHE_MAX_ENTRIES
+        self._mutex = threading.Lock()
+        self._values = OrderedDict()
+        self._locks = {}
+
+    def get(self, key):
+        with self._mutex:
+            entry = self._values.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._values[key]
+                return None
+            self._values.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None):
+        now = time.monotonic()
+        expires_at = now + ttl if ttl else None
+        with self._mutex:
+            self._values[key] = (value, expires_at)
+            self._values.move_to_end(key)
+            if len(self._values) > self.max_entries:
+                for expired_key in [k for k, (_, expires) in self._values.items() if expires is not None and expires <= now]:
+                    del self._values[expired_key]
+            while len(self._values) > self.max_entries:
+                self._values.popitem(last=False)
+
+    def acquire_lock(self, name, timeout):
+        now = time.monotonic()
+        with self._mutex:
+            held = self._locks.get(name)
+            if held is not None and held[1] > now:
+                return None
+            token = uuid.uuid4().hex
+            self._locks[name] = (token, now + timeout)
+            return token
+
+    def release_lock(self, name, token):
+        with self._mutex:
+            held = self._locks.get(name)
+            if held is not None and held[0] == token:
+                del self._locks[name]
+
+
+class RedisCache(CacheBackend):
+    """Cache and locks in a Redis-compatible store, shared by all replicas"""
+
+    def __init__(self, url=None, prefix='', client=None):
+        if client is None:
+            import redis
+            client = redis.Redis.from_url(url)
+        self.client = client
+        self.prefix = prefix
+
+    def get(self, key):
+        value = self.client.get(self.prefix + key)
+        return value.decode('utf-8') if value is not None else None
+
+    def set(self, key, value, ttl=None):
+        self.client.set(self.prefix + key, value.encode('utf-8'), ex=ttl or None)
+
+    def acquire_lock(self, name, timeout):
+        token = uuid.uuid4().hex
+        acquired = self.client.set(self.prefix + name, token, nx=True, px=int(timeout * 1000))
+        return token if acquired else None
+
+    def release_lock(self, name, token):
+        from redis.exceptions import WatchError
+        key = self.prefix + name
+        # Only delete the lock if it still carries our token, so an expired
+        # lock that another replica has since taken is left alone
+        with self.client.pipeline() as pipe:
+            try:
+                pipe.watch(key)
+                held = pipe.get(key)
+                if held is not None and held.decode('utf-8') == token:
+                    pipe.multi()
+                    pipe.delete(key)
+                    pipe.execute()
+                else:
+                    pipe.unwatch()
+            except WatchError:
+                pass
+
+
+_cache = None
+_cache_mutex = threading.Lock()
+
+def create_cache():
+    """Create the cache backend selected by Config.CACHE_BACKEND"""
+    if Config.CACHE_BACKEND == 'local':
+        return LocalCache()
+    if Config.CACHE_BACKEND == 'redis':
+        return RedisCache(Config.REDIS_URL, Config.CACHE_PREFIX)
+    raise ValueError(f"Unknown CACHE_BACKEND: {Config.CACHE_BACKEND}")
+
+def get_cache():
+    """Return the shared cache backend, creating it on first use"""
+    global _cache
+    with _cache_mutex:
+        if _cache is None:
+            _cache = create_cache()
+    return _cache
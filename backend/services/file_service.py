@@ -1,31 +1,34 @@
-import os
 import json
 from config import Config
+from services.storage_service import get_storage, storage_key
 
 class FileService:
     @staticmethod
     def save_json_data(data, filename):
         """Save data as JSON file"""
-        file_path = os.path.join(Config.DATA_DIR, filename)
-        with open(file_path, 'w', encoding='utf-8') as file:
-            json.dump(data, file, ensure_ascii=False, indent=2)
-        return file_path
+        file_path = storage_key(Config.DATA_DIR, filename)
+        return get_storage().put_text(file_path, json.dumps(data, ensure_ascii=False, indent=2))
     
     @staticmethod
     def load_json_data(filename):
         """Load JSON data from file"""
-        file_path = os.path.join(Config.DATA_DIR, filename)
-        if not os.path.exists(file_path):
+        file_path = storage_key(Config.DATA_DIR, filename)
+        try:
+            return json.loads(get_storage().get_text(file_path))
+        except (FileNotFoundError, json.JSONDecodeError):
             return None
-        
-        with open(file_path, 'r', encoding='utf-8') as file:
-            try:
-                return json.load(file)
-            except json.JSONDecodeError:
-                return None
+    
+    @staticmethod
+    def save_file(folder, filename, data):
+        """Save raw bytes to a file in specified folder"""
+        return get_storage().put_bytes(storage_key(folder, filename), data)
+    
+    @staticmethod
+    def read_file(folder, filename):
+        """Read raw bytes from a file in specified folder"""
+        return get_storage().get_bytes(storage_key(folder, filename))
     
     @staticmethod
     def file_exists(folder, filename):
         """Check if file exists in specified folder"""
-        file_path = os.path.join(folder, filename)
-        return os.path.exists(file_path)
+        return get_storage().exists(storage_key(folder, filename))
@@ -1,24 +1,107 @@
-import os
+import json
+import hashlib
+from io import BytesIO
 from PyPDF2 import PdfReader
 from config import Config
+from services.storage_service import get_storage, storage_key
+from services.cache_service import get_cache
+from utils.validators import validate_document_id
 
 class PDFService:
     @staticmethod
-    def extract_text_from_pdf(pdf_path):
-        """Extract text from PDF file"""
-        if not os.path.exists(pdf_path):
-            raise FileNotFoundError("PDF file not found")
+    def extract_pages(pdf_data):
+        """Extract text from PDF bytes as a list with one entry per page"""
+        reader = PdfReader(BytesIO(pdf_data))
+        return [page.extract_text() or '' for page in reader.pages]
+    
+    @staticmethod
+    def extract_document(document_id):
+        """Extract an uploaded PDF once and return its pages.
+
+        Already extracted documents are read from storage without locking. On a
+        miss, replicas that receive the same PDF wait on a shared lock and reuse
+        the stored document instead of extracting it again.
+        """
+        pages = PDFService.load_document_pages(document_id)
+        if pages is not None:
+            return pages
         
-        reader = PdfReader(pdf_path)
-        text = ''
-        for page in reader.pages:
-            text += page.extract_text() or ''
-        return text
+        with get_cache().lock(f'lock:extract:{document_id}'):
+            pages = PDFService.load_document_pages(document_id)
+            if pages is None:
+                pages = PDFService.extract_pages(PDFService._load_pdf(PDFService.upload_path(document_id)))
+                PDFService.save_document(document_id, pages)
+                PDFService.save_extracted_text(''.join(pages), PDFService.extracted_text_filename(document_id))
+        return pages
+    
+    @staticmethod
+    def get_document_id(pdf_data):
+        """Derive a stable document id from the PDF file contents"""
+        return hashlib.sha256(pdf_data).hexdigest()[:32]
+    
+    @staticmethod
+    def upload_path(document_id):
+        """Resolve the storage key of the uploaded PDF for a document id"""
+        PDFService._check_document_id(document_id)
+        return storage_key(Config.UPLOAD_FOLDER, f'{document_id}.pdf')
+    
+    @staticmethod
+    def extracted_text_filename(document_id):
+        """Return the filename of the plain-text copy of a document"""
+        PDFService._check_document_id(document_id)
+        return f'extracted_text_{document_id}.txt'
     
     @staticmethod
     def save_extracted_text(text, filename='extracted_text.txt'):
         """Save extracted text to file"""
-        text_file_path = os.path.join(Config.DATA_DIR, filename)
-        with open(text_file_path, 'w', encoding='utf-8') as file:
-            file.write(text)
-        return text_file_path
+        text_file_path = storage_key(Config.DATA_DIR, filename)
+        return get_storage().put_text(text_file_path, text)
+    
+    @staticmethod
+    def save_document(document_id, pages):
+        """Save extracted pages so later requests can reference them by id"""
+        file_path = PDFService._document_path(document_id)
+        return get_storage().put_text(file_path, json.dumps({'document_id': document_id, 'pages': pages}, ensure_ascii=False))
+    
+    @staticmethod
+    def load_document_pages(document_id):
+        """Load the saved pages of a document, or None if it has not been extracted"""
+        try:
+            return json.loads(get_storage().get_text(PDFService._document_path(document_id)))['pages']
+        except FileNotFoundError:
+            return None
+    
+    @staticmethod
+    def load_document_text(document_id, page_start=None, page_end=None):
+        """Load saved document text, optionally limited to a 1-based inclusive page range"""
+        pages = PDFService.load_document_pages(document_id)
+        if pages is None:
+            raise FileNotFoundError("Document not found")
+        
+        page_start = 1 if page_start is None else page_start
+        page_end = len(pages) if page_end is None else page_end
+        if page_start < 1 or page_end > len(pages) or page_start > page_end:
+            raise ValueError(f"Invalid page range {page_start}-{page_end} for document with {len(pages)} pages")
+        
+        return ''.join(pages[page_start - 1:page_end])
+    
+    @staticmethod
+    def _load_pdf(pdf_path):
+        """Read PDF bytes from storage"""
+        try:
+            return get_storage().get_bytes(pdf_path)
+        except FileNotFoundError:
+            raise FileNotFoundError("PDF file not found")
+    
+    @staticmethod
+    def _document_path(document_id):
+        """Resolve the storage key for a document id"""
+        PDFService._check_document_id(document_id)
+        return storage_key(Config.DATA_DIR, f'document_{document_id}.json')
+    
+    @staticmethod
+    def _check_document_id(document_id):
+        """Reject document ids that could escape the storage folders"""
+        is_valid, message = validate_document_id(document_id)
+        if not is_valid:
+            raise ValueError(message)
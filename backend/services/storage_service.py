@@ -0,0 +1,121 @@
+import os
+import uuid
+import threading
+from config import Config
+
+class StorageBackend:
+    """Key/value blob storage shared by all services.
+
+    Keys are relative, '/'-separated paths such as 'data/extracted_text.txt'.
+    """
+
+    def put_bytes(self, key, data):
+        """Store bytes under key and return the key"""
+        raise NotImplementedError
+
+    def get_bytes(self, key):
+        """Return the bytes stored under key, raising FileNotFoundError if missing"""
+        raise NotImplementedError
+
+    def exists(self, key):
+        """Check if key exists"""
+        raise NotImplementedError
+
+    def put_text(self, key, text):
+        """Store UTF-8 text under key and return the key"""
+        return self.put_bytes(key, text.encode('utf-8'))
+
+    def get_text(self, key):
+        """Return the UTF-8 text stored under key"""
+        return self.get_bytes(key).decode('utf-8')
+
+
+class LocalStorage(StorageBackend):
+    """Storage on the local filesystem, for single-replica deployments"""
+
+    def __init__(self, root='.'):
+        self.root = root
+
+    def _path(self, key):
+        return os.path.join(self.root, *key.split('/'))
+
+    def put_bytes(self, key, data):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write to a temporary file first so readers never see a partial file
+        temp_path = f'{path}.{uuid.uuid4().hex}.tmp'
+        with open(temp_path, 'wb') as file:
+            file.write(data)
+        os.replace(temp_path, path)
+        return key
+
+    def get_bytes(self, key):
+        path = self._path(key)
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"{key} not found")
+        with open(path, 'rb') as file:
+            return file.read()
+
+    def exists(self, key):
+        return os.path.exists(self._path(key))
+
+
+class S3Storage(StorageBackend):
+    """Storage in an S3-compatible object store (AWS S3, MinIO, ...), shared by all replicas"""
+
+    def __init__(self, bucket, prefix='', endpoint_url=None, client=None):
+        if client is None:
+            import boto3
+            client = boto3.client('s3', endpoint_url=endpoint_url)
+        self.client = client
+        self.bucket = bucket
+        self.prefix = prefix.strip('/')
+
+    def _key(self, key):
+        return f'{self.prefix}/{key}' if self.prefix else key
+
+    def put_bytes(self, key, data):
+        self.client.put_object(Bucket=self.bucket, Key=self._key(key), Body=data)
+        return key
+
+    def get_bytes(self, key):
+        try:
+            response = self.client.get_object(Bucket=self.bucket, Key=self._key(key))
+        except self.client.exceptions.NoSuchKey:
+            raise FileNotFoundError(f"{key} not found")
+        return response['Body'].read()
+
+    def exists(self, key):
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=self._key(key))
+        except self.client.exceptions.ClientError as e:
+            if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+                return False
+            raise
+        return True
+
+
+_storage = None
+_storage_mutex = threading.Lock()
+
+def create_storage():
+    """Create the storage backend selected by Config.STORAGE_BACKEND"""
+    if Config.STORAGE_BACKEND == 'local':
+        return LocalStorage()
+    if Config.STORAGE_BACKEND == 's3':
+        if not Config.S3_BUCKET:
+            raise ValueError("S3_BUCKET is required when STORAGE_BACKEND is 's3'")
+        return S3Storage(Config.S3_BUCKET, Config.S3_PREFIX, Config.S3_ENDPOINT_URL)
+    raise ValueError(f"Unknown STORAGE_BACKEND: {Config.STORAGE_BACKEND}")
+
+def get_storage():
+    """Return the shared storage backend, creating it on first use"""
+    global _storage
+    with _storage_mutex:
+        if _storage is None:
+            _storage = create_storage()
+    return _storage
+
+def storage_key(folder, filename):
+    """Build a storage key from a folder and filename"""
+    return f'{folder}/{filename}'
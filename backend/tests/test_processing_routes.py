@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Test script to verify text extraction references, page ranges and gzip/zstd
+content negotiation through the Flask test client. The AI provider is
+replaced by a stub that echoes the text it was given.
+"""
+import os
+import gzip
+import json
+import time
+import tempfile
+from io import BytesIO
+from contextlib import contextmanager
+import zstandard
+from PyPDF2 import PdfWriter
+
+@contextmanager
+def app_client():
+    """Run the app in a temporary working directory with a stubbed AI provider"""
+    import services.storage_service as storage_service
+    import services.cache_service as cache_service
+    from services.ai_service import AIService
+    from app import create_app
+
+    original_cwd = os.getcwd()
+    original_gemini = AIService.process_with_gemini
+    with tempfile.TemporaryDirectory() as root:
+        os.chdir(root)
+        storage_service._storage = None
+        cache_service._cache = None
+        AIService.process_with_gemini = staticmethod(
+            lambda api_key, prompt: json.dumps({'text': prompt.split('Text:')[1].strip()})
+        )
+        try:
+            yield create_app().test_client()
+        finally:
+            AIService.process_with_gemini = original_gemini
+            storage_service._storage = None
+            cache_service._cache = None
+            os.chdir(original_cwd)
+
+def make_pdf(page_count=2):
+    """Return the bytes of a PDF with blank pages"""
+    writer = PdfWriter()
+    for _ in range(page_count):
+        writer.add_blank_page(100, 100)
+    buffer = BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+def clean_request(**fields):
+    """Build a /clean-with-ai request body"""
+    body = {'user_prompt': 'Extract', 'ai_provider': 'google', 'user_api_key': 'test-key'}
+    body.update(fields)
+    return body
+
+def test_metadata_only():
+    """Test that metadata_only omits the text and only accepts true"""
+    print("🔍 Testing metadata_only...")
+    with app_client() as client:
+        response = client.post('/upload', data={'file': (BytesIO(make_pdf(3)), 'example.pdf')})
+        document_id = response.json['document_id']
+
+        response = client.post('/extract-text', json={'document_id': document_id, 'metadata_only': True})
+        assert response.status_code == 200
+        assert 'text' not in response.json
+        assert response.json['page_count'] == 3
+        assert response.json['document_id'] == document_id
+
+        response = client.post(f'/extract-text?document_id={document_id}&metadata_only=true')
+        assert 'text' not in response.json
+
+        for value in ('false', 'yes', 1):
+            response = client.post('/extract-text', json={'document_id': document_id, 'metadata_only': value})
+            assert 'text' in response.json, value
+    print("✅ metadata_only works")
+
+def test_document_reference_page_range():
+    """Test cleaning a stored document by id and page range"""
+    print("🔍 Testing document_id references...")
+    from services.pdf_service import PDFService
+
+    with app_client() as client:
+        document_id = 'a' * 32
+        PDFService.save_document(document_id, ['one ', 'two ', 'three'])
+
+        response = client.post('/clean-with-ai', json=clean_request(document_id=document_id))
+        assert response.status_code == 200
+        assert response.json['content']['text'] == 'one two three'
+
+        response = client.post('/clean-with-ai', json=clean_request(document_id=document_id, page_start=2, page_end=3))
+        assert response.status_code == 200
+        assert response.json['content']['text'] == 'two three'
+
+        response = client.post('/clean-with-ai', json=clean_request(document_id=document_id, page_end=9))
+        assert response.status_code == 400
+        assert 'Invalid page range' in response.json['error']
+
+        for value in ([1], 'x', True, 1.5):
+            response = client.post('/clean-with-ai', json=clean_request(document_id=document_id, page_start=value))
+            assert response.status_code == 400, value
+            assert response.json['error'] == 'page_start must be an integer'
+
+        response = client.post('/clean-with-ai', json=clean_request(document_id='../secret'))
+        assert response.status_code == 400
+        assert response.json['error'] == 'Invalid document_id'
+
+        response = client.post('/clean-with-ai', json=clean_request(document_id='b' * 32))
+        assert response.status_code == 404
+    print("✅ document_id references work")
+
+def test_response_compression():
+    """Test gzip/zstd negotiation for large responses"""
+    print("🔍 Testing response compression...")
+    from services.pdf_service import PDFService
+
+    with app_client() as client:
+        document_id = 'c' * 32
+        PDFService.save_document(document_id, ['x' * 5000])
+        body = clean_request(document_id=document_id)
+
+        response = client.post('/clean-with-ai', json=body, headers={'Accept-Encoding': 'gzip, zstd'})
+        assert response.headers['Content-Encoding'] == 'zstd'
+        assert 'Accept-Encoding' in response.headers['Vary']
+        data = zstandard.ZstdDecompressor().decompressobj().decompress(response.data)
+        assert json.loads(data)['content']['text'] == 'x' * 5000
+
+        response = client.post('/clean-with-ai', json=body, headers={'Accept-Encoding': 'gzip, zstd;q=0'})
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert json.loads(gzip.decompress(response.data))['content']['text'] == 'x' * 5000
+
+        response = client.post('/clean-with-ai', json=body)
+        assert 'Content-Encoding' not in response.headers
+
+        # Small responses are sent as-is
+        response = client.get('/', headers={'Accept-Encoding': 'gzip'})
+        assert 'Content-Encoding' not in response.headers
+    print("✅ Response compression works")
+
+def test_compressed_request_bodies():
+    """Test decoding gzip/zstd request bodies and their error cases"""
+    print("🔍 Testing compressed request bodies...")
+    from config import Config
+
+    with app_client() as client:
+        raw = json.dumps(clean_request(extracted_text='hello world')).encode('utf-8')
+        headers = {'Content-Type': 'application/json'}
+
+        response = client.post('/clean-with-ai', data=gzip.compress(raw), headers={**headers, 'Content-Encoding': 'gzip'})
+        assert response.status_code == 200
+        assert response.json['content']['text'] == 'hello world'
+
+        # Multiple zstd frames are decoded as one body
+        compressor = zstandard.ZstdCompressor()
+        frames = compressor.compress(raw[:10]) + compressor.compress(raw[10:])
+        response = client.post('/clean-with-ai', data=frames, headers={**headers, 'Content-Encoding': 'zstd'})
+        assert response.status_code == 200
+        assert response.json['content']['text'] == 'hello world'
+
+        # Multiple gzip members are decoded as one body
+        members = gzip.compress(raw[:10]) + gzip.compress(raw[10:])
+        response = client.post('/clean-with-ai', data=members, headers={**headers, 'Content-Encoding': 'gzip'})
+        assert response.status_code == 200
+        assert response.json['content']['text'] == 'hello world'
+
+        response = client.post('/clean-with-ai', data=b'not gzip', headers={**headers, 'Content-Encoding': 'gzip'})
+        assert response.status_code == 400
+
+        # A gzip body missing its CRC/size trailer is rejected
+        response = client.post('/clean-with-ai', data=gzip.compress(raw)[:-8], headers={**headers, 'Content-Encoding': 'gzip'})
+        assert response.status_code == 400
+
+        response = client.post('/clean-with-ai', data=raw, headers={**headers, 'Content-Encoding': 'br'})
+        assert response.status_code == 415
+
+        original_max = Config.MAX_DECOMPRESSED_SIZE
+        Config.MAX_DECOMPRESSED_SIZE = 10
+        try:
+            response = client.post('/clean-with-ai', data=gzip.compress(raw), headers={**headers, 'Content-Encoding': 'gzip'})
+            assert response.status_code == 413
+        finally:
+            Config.MAX_DECOMPRESSED_SIZE = original_max
+    print("✅ Compressed request bodies work")
+
+def test_uploads_are_keyed_by_content():
+    """Test that each upload gets its own document id and storage key"""
+    print("🔍 Testing per-upload keys...")
+    with app_client() as client:
+        first = client.post('/upload', data={'file': (BytesIO(make_pdf(1)), 'one.pdf')}).json
+        second = client.post('/upload', data={'file': (BytesIO(make_pdf(2)), 'two.pdf')}).json
+        assert first['document_id'] != second['document_id']
+        assert first['file_path'] == f"uploads/{first['document_id']}.pdf"
+
+        # The first upload is still extracted after a later upload
+        response = client.post('/extract-text', json={'document_id': first['document_id']})
+        assert response.json['page_count'] == 1
+
+        from services.storage_service import get_storage
+        assert get_storage().exists(response.json['file_url'])
+
+        # Already extracted documents are served without taking the extraction
+        # lock or writing to storage
+        import services.pdf_service as pdf_service
+        storage = get_storage()
+        original_get_cache = pdf_service.get_cache
+        original_put_bytes = storage.put_bytes
+        pdf_service.get_cache = lambda: (_ for _ in ()).throw(AssertionError("lock taken on a hit"))
+        storage.put_bytes = lambda key, data: (_ for _ in ()).throw(AssertionError(f"{key} written on a hit"))
+        try:
+            response = client.post('/extract-text', json={'document_id': first['document_id'], 'metadata_only': True})
+            assert response.status_code == 200
+        finally:
+            pdf_service.get_cache = original_get_cache
+            storage.put_bytes = original_put_bytes
+
+        response = client.get(f"/uploaded-file-url?document_id={second['document_id']}")
+        assert response.json['file_url'] == second['file_path']
+        response = client.get(f"/download-pdf-file?document_id={second['document_id']}")
+        assert response.data.startswith(b'%PDF')
+
+        assert client.post('/extract-text', json={}).status_code == 400
+        assert client.post('/extract-text', json={'document_id': '../x'}).status_code == 400
+        assert client.post('/extract-text', json={'document_id': 'd' * 32}).status_code == 404
+        assert client.get('/download-pdf-file').status_code == 400
+        assert client.get(f"/uploaded-file-url?document_id={'d' * 32}").status_code == 404
+    print("✅ Per-upload keys work")
+
+def test_ai_cache_is_per_api_key():
+    """Test that cached AI responses are not shared across API keys and can be bypassed"""
+    print("🔍 Testing AI response cache keys...")
+    from services.ai_service import AIService
+
+    with app_client() as client:
+        calls = []
+
+        def process(api_key, prompt):
+            calls.append(api_key)
+            if api_key == 'revoked-key':
+                raise ValueError("Invalid Gemini API key: revoked")
+            return json.dumps({'call': len(calls)})
+        AIService.process_with_gemini = staticmethod(process)
+
+        body = clean_request(extracted_text='same text', user_api_key='good-key')
+        assert client.post('/clean-with-ai', json=body).json['content'] == {'call': 1}
+        assert client.post('/clean-with-ai', json=body).json['content'] == {'call': 1}
+        assert calls == ['good-key']
+
+        response = client.post('/clean-with-ai', json={**body, 'user_api_key': 'revoked-key'})
+        assert response.status_code == 401
+        assert calls == ['good-key', 'revoked-key']
+
+        # no_cache asks the provider again and replaces the cached response
+        assert client.post('/clean-with-ai', json={**body, 'no_cache': True}).json['content'] == {'call': 3}
+        assert client.post('/clean-with-ai', json=body).json['content'] == {'call': 3}
+        assert client.post('/clean-with-ai', json={**body, 'no_cache': 'false'}).json['content'] == {'call': 3}
+
+        # Cleaned data is saved per cache entry rather than to one shared file
+        client.post('/clean-with-ai', json={**body, 'user_api_key': 'other-key'})
+        cleaned_files = sorted(name for name in os.listdir('data') if name.startswith('cleaned_data'))
+        assert len(cleaned_files) == 2
+        assert 'cleaned_data.json' not in cleaned_files
+
+        # Responses are only kept for the short coalescing window
+        from config import Config
+        original_ttl = Config.AI_CACHE_TTL
+        Config.AI_CACHE_TTL = 0.05
+        try:
+            first = client.post('/clean-with-ai', json={**body, 'extracted_text': 'rerun'}).json['content']
+            time.sleep(0.1)
+            second = client.post('/clean-with-ai', json={**body, 'extracted_text': 'rerun'}).json['content']
+            assert first != second
+        finally:
+            Config.AI_CACHE_TTL = original_ttl
+    print("✅ AI response cache is keyed per API key")
+
+if __name__ == "__main__":
+    print("=" * 50)
+    print("🧪 PROCESSING ROUTES TEST")
+    print("=" * 50)
+
+    test_metadata_only()
+    test_document_reference_page_range()
+    test_response_compression()
+    test_compressed_request_bodies()
+    test_uploads_are_keyed_by_content()
+    test_ai_cache_is_per_api_key()
+
+    print("\n🎉 All processing route tests passed!")
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the storage and cache backends, including single-flight
+locking across simulated replicas. The Redis and S3 checks run against the
+fakeredis and moto stand-ins when they are installed.
+"""
+import tempfile
+import threading
+import time
+
+def run_concurrently(caches, compute, key='ai:test'):
+    """Call single_flight on every cache at once and return the results"""
+    results = []
+    barrier = threading.Barrier(len(caches))
+
+    def worker(cache):
+        barrier.wait()
+        results.append(cache.single_flight(key, compute, ttl=60))
+
+    threads = [threading.Thread(target=worker, args=(cache,)) for cache in caches]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+def counting_compute():
+    """Return a compute function that records how often it ran"""
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.3)
+        return 'result'
+    return compute, calls
+
+def test_local_storage():
+    """Test local filesystem storage"""
+    print("🔍 Testing local storage...")
+    from services.storage_service import LocalStorage
+
+    with tempfile.TemporaryDirectory() as root:
+        storage = LocalStorage(root)
+        assert not storage.exists('data/example.txt')
+        storage.put_text('data/example.txt', 'hello')
+        assert storage.exists('data/example.txt')
+        assert storage.get_text('data/example.txt') == 'hello'
+        try:
+            storage.get_bytes('data/missing.txt')
+            assert False, "Expected FileNotFoundError"
+        except FileNotFoundError:
+            pass
+    print("✅ Local storage works")
+
+def test_local_cache_single_flight():
+    """Test that concurrent requests in one process compute once"""
+    print("🔍 Testing local cache single-flight...")
+    from services.cache_service import LocalCache
+
+    cache = LocalCache()
+    compute, calls = counting_compute()
+    results = run_concurrently([cache] * 5, compute)
+    assert results == ['result'] * 5
+    assert len(calls) == 1
+    print("✅ Local cache computed once for 5 concurrent requests")
+
+def test_local_cache_eviction():
+    """Test that the local cache stays within its size bound"""
+    print("🔍 Testing local cache eviction...")
+    from services.cache_service import LocalCache
+
+    cache = LocalCache(max_entries=3)
+    cache.set('expired', 'value', ttl=0.01)
+    cache.set('a', '1')
+    cache.set('b', '2')
+    time.sleep(0.02)
+    cache.set('c', '3')
+    # The expired entry is swept before any live entry is evicted
+    assert [cache.get(key) for key in ('expired', 'a', 'b', 'c')] == [None, '1', '2', '3']
+
+    cache.get('a')
+    cache.set('d', '4')
+    # 'b' is now the least recently used entry
+    assert cache.get('b') is None
+    assert [cache.get(key) for key in ('a', 'c', 'd')] == ['1', '3', '4']
+    assert len(cache._values) == 3
+    print("✅ Local cache evicts expired and least recently used entries")
+
+def test_single_flight_refresh():
+    """Test that refresh recomputes a cached value"""
+    print("🔍 Testing single-flight refresh...")
+    from services.cache_service import LocalCache
+
+    cache = LocalCache()
+    values = iter(['first', 'second'])
+    assert cache.single_flight('key', lambda: next(values)) == 'first'
+    assert cache.single_flight('key', lambda: next(values)) == 'first'
+    assert cache.single_flight('key', lambda: next(values), refresh=True) == 'second'
+    assert cache.get('key') == 'second'
+    print("✅ Single-flight refresh works")
+
+def test_redis_cache_single_flight():
+    """Test that replicas sharing a Redis-compatible store compute once"""
+    print("🔍 Testing Redis cache single-flight...")
+    try:
+        import fakeredis
+    except ImportError:
+        print("⚠️  fakeredis not installed, skipping")
+        return
+    from services.cache_service import RedisCache
+
+    server = fakeredis.FakeServer()
+    # Each replica has its own client connected to the same server
+    replicas = [RedisCache(prefix='test:', client=fakeredis.FakeRedis(server=server)) for _ in range(3)]
+    compute, calls = counting_compute()
+    results = run_concurrently(replicas, compute)
+    assert results == ['result'] * 3
+    assert len(calls) == 1
+
+    # A lock taken by one replica is not released by another's stale token
+    token = replicas[0].acquire_lock('lock:other', 60)
+    assert replicas[1].acquire_lock('lock:other', 60) is None
+    replicas[1].release_lock('lock:other', 'stale-token')
+    assert replicas[2].acquire_lock('lock:other', 60) is None
+    replicas[0].release_lock('lock:other', token)
+    assert replicas[2].acquire_lock('lock:other', 60) is not None
+    print("✅ Redis cache computed once for 3 replicas")
+
+def test_s3_storage():
+    """Test S3-compatible object storage"""
+    print("🔍 Testing S3 storage...")
+    try:
+        import boto3
+        from moto import mock_aws
+    except ImportError:
+        print("⚠️  boto3/moto not installed, skipping")
+        return
+    from services.storage_service import S3Storage
+
+    with mock_aws():
+        client = boto3.client('s3', region_name='us-east-1')
+        client.create_bucket(Bucket='test-bucket')
+        storage = S3Storage('test-bucket', prefix='replica-set', client=client)
+        assert not storage.exists('uploads/uploaded_file.pdf')
+        storage.put_bytes('uploads/uploaded_file.pdf', b'%PDF')
+        assert storage.exists('uploads/uploaded_file.pdf')
+        assert storage.get_bytes('uploads/uploaded_file.pdf') == b'%PDF'
+        try:
+            storage.get_bytes('uploads/missing.pdf')
+            assert False, "Expected FileNotFoundError"
+        except FileNotFoundError:
+            pass
+    print("✅ S3 storage works")
+
+if __name__ == "__main__":
+    print("=" * 50)
+    print("🧪 STORAGE AND CACHE BACKEND TEST")
+    print("=" * 50)
+
+    test_local_storage()
+    test_local_cache_single_flight()
+    test_local_cache_eviction()
+    test_single_flight_refresh()
+    test_redis_cache_single_flight()
+    test_s3_storage()
+
+    print("\n🎉 All storage tests passed!")
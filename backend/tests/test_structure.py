@@ -23,6 +23,12 @@ def test_imports():
         from services.template_service import TemplateService
         print("✅ Template Service module imported successfully")
         
+        from services.storage_service import get_storage
+        print("✅ Storage Service module imported successfully")
+        
+        from services.cache_service import get_cache
+        print("✅ Cache Service module imported successfully")
+        
         from routes.upload_routes import upload_bp
         print("✅ Upload routes module imported successfully")
         
@@ -38,6 +44,9 @@ def test_imports():
         from utils.constants import AI_PROVIDERS
         print("✅ Constants module imported successfully")
         
+        from utils.compression import init_compression
+        print("✅ Compression module imported successfully")
+        
         from models.schemas import UploadResponse
         print("✅ Schemas module imported successfully")
         
@@ -0,0 +1,119 @@
+import gzip
+import zlib
+from io import BytesIO
+import zstandard
+from flask import request, jsonify
+from config import Config
+
+# Encodings we can produce, in order of preference
+SUPPORTED_ENCODINGS = ['zstd', 'gzip']
+
+COMPRESSIBLE_MIMETYPES = ['application/json', 'text/plain', 'text/html']
+
+def init_compression(app):
+    """Register request decompression and response compression hooks"""
+    app.before_request(decompress_request)
+    app.after_request(compress_response)
+
+def choose_encoding(accept_encoding):
+    """Pick the preferred encoding the client accepts, or None"""
+    accepted = {}
+    for part in accept_encoding.split(','):
+        name, _, params = part.strip().partition(';')
+        quality = 1.0
+        if params.strip().startswith('q='):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+    
+    for encoding in SUPPORTED_ENCODINGS:
+        if accepted.get(encoding, accepted.get('*', 0.0)) > 0:
+            return encoding
+    return None
+
+def compress(data, encoding):
+    """Compress bytes with the given content encoding"""
+    if encoding == 'zstd':
+        return zstandard.ZstdCompressor(level=Config.ZSTD_LEVEL).compress(data)
+    return gzip.compress(data, compresslevel=Config.GZIP_LEVEL)
+
+def decompress(data, encoding, max_size):
+    """Decompress bytes with the given content encoding, refusing output larger than max_size"""
+    if encoding == 'zstd':
+        chunks = []
+        size = 0
+        with zstandard.ZstdDecompressor().stream_reader(BytesIO(data), read_across_frames=True) as reader:
+            # read() may stop short at frame boundaries, so keep reading until EOF
+            while size <= max_size:
+                chunk = reader.read(max_size + 1 - size)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                size += len(chunk)
+        result = b''.join(chunks)
+    else:
+        chunks = []
+        size = 0
+        # A gzip body may hold several members; decode each one in turn
+        while size <= max_size:
+            decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            chunk = decompressor.decompress(data, max_size + 1 - size)
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > max_size:
+                break
+            if not decompressor.eof:
+                raise zlib.error("Truncated gzip stream")
+            data = decompressor.unused_data
+            if not data:
+                break
+        result = b''.join(chunks)
+
+    if len(result) > max_size:
+        raise ValueError("Decompressed request body is too large")
+    return result
+
+def decompress_request():
+    """Transparently decode gzip or zstd encoded request bodies"""
+    encoding = (request.headers.get('Content-Encoding') or '').strip().lower()
+    if not encoding or encoding == 'identity':
+        return None
+    if encoding not in SUPPORTED_ENCODINGS:
+        return jsonify({'error': f'Unsupported Content-Encoding: {encoding}'}), 415
+    
+    try:
+        data = decompress(request.get_data(cache=False), encoding, Config.MAX_DECOMPRESSED_SIZE)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 413
+    except (zlib.error, zstandard.ZstdError):
+        return jsonify({'error': f'Invalid {encoding} request body'}), 400
+    
+    # Swap in the decoded body so handlers see a plain request
+    request.environ['wsgi.input'] = BytesIO(data)
+    request.environ['CONTENT_LENGTH'] = str(len(data))
+    request.environ.pop('HTTP_CONTENT_ENCODING', None)
+    request.__dict__.pop('stream', None)
+    return None
+
+def compress_response(response):
+    """Compress large responses when the client negotiates gzip or zstd"""
+    if (response.direct_passthrough
+            or response.status_code < 200 or response.status_code >= 300
+            or 'Content-Encoding' in response.headers
+            or response.mimetype not in COMPRESSIBLE_MIMETYPES):
+        return response
+    
+    response.vary.add('Accept-Encoding')
+    encoding = choose_encoding(request.headers.get('Accept-Encoding', ''))
+    if encoding is None:
+        return response
+    
+    data = response.get_data()
+    if len(data) < Config.COMPRESSION_MIN_SIZE:
+        return response
+    
+    response.set_data(compress(data, encoding))
+    response.headers['Content-Encoding'] = encoding
+    return response
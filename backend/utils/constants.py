@@ -11,6 +11,9 @@ DEFAULT_UPLOAD_FILENAME = 'uploaded_file.pdf'
 DEFAULT_EXTRACTED_TEXT_FILENAME = 'extracted_text.txt'
 DEFAULT_CLEANED_DATA_FILENAME = 'cleaned_data.json'
 
+# Document ids are the first 32 hex characters of the PDF's SHA-256
+DOCUMENT_ID_PATTERN = r'^[0-9a-f]{32}$'
+
 # HTTP status codes
 HTTP_OK = 200
 HTTP_BAD_REQUEST = 400
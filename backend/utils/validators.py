@@ -1,3 +1,6 @@
+import re
+from utils.constants import DOCUMENT_ID_PATTERN
+
 def validate_file_upload(file):
     """Validate uploaded file"""
     if not file:
@@ -13,14 +16,36 @@ def validate_file_upload(file):
 
 def validate_ai_request(data):
     """Validate AI processing request"""
-    required_fields = ['user_prompt', 'extracted_text']
+    if not data.get('user_prompt'):
+        return False, "Missing required field: user_prompt"
     
-    for field in required_fields:
-        if not data.get(field):
-            return False, f"Missing required field: {field}"
+    if not data.get('extracted_text') and not data.get('document_id'):
+        return False, "Missing required field: extracted_text or document_id"
     
     ai_provider = data.get('ai_provider', 'gemini')
     if ai_provider not in ['gemini', 'openai']:
         return False, "Invalid AI provider. Must be 'gemini' or 'openai'"
     
     return True, "Valid request"
+
+def validate_page_range(page_start, page_end):
+    """Validate an optional 1-based page range"""
+    for name, value in (('page_start', page_start), ('page_end', page_end)):
+        if value is not None and (isinstance(value, bool) or not isinstance(value, int)):
+            return False, f"{name} must be an integer"
+    
+    return True, "Valid page range"
+
+def validate_document_id(document_id):
+    """Validate a document id returned by /upload or /extract-text"""
+    if not document_id:
+        return False, "Missing required field: document_id"
+    
+    if not isinstance(document_id, str) or not re.match(DOCUMENT_ID_PATTERN, document_id):
+        return False, "Invalid document_id"
+    
+    return True, "Valid document id"
+
+def is_true_flag(value):
+    """Check if a JSON or query-string flag is set to true"""
+    return value is True or value == 'true'
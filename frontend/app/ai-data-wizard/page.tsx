@@ -28,6 +28,7 @@ export default function DataCleaningPipeline() {
     currentStep,
     steps,
     uploadedFile,
+    uploadedDocumentId,
     extractedText,
     processedData,
     cleanedDataCSV,
@@ -48,6 +49,7 @@ export default function DataCleaningPipeline() {
     previousStep,
     updateStepStatus,
     setUploadedFile,
+    setUploadedDocumentId,
     setExtractedText,
     setProcessedData,
     updateColumnOrder,
@@ -96,8 +98,9 @@ export default function DataCleaningPipeline() {
   }, [hasHydrated, restoreFileFromPersisted]);
 
   // Event handlers
-  const handleFileUpload = (file: File) => {
+  const handleFileUpload = (file: File, documentId: string) => {
     setUploadedFile(file);
+    setUploadedDocumentId(documentId);
     updateStepStatus(0, 'complete');
     notify.success('File Upload', `Successfully uploaded ${file.name}`);
   };
@@ -161,6 +164,7 @@ export default function DataCleaningPipeline() {
         return (
           <TextExtractionStep
             uploadedFile={uploadedFile}
+            uploadedDocumentId={uploadedDocumentId}
             extractedText={extractedText}
             isExtracting={isExtracting}
             onExtractionStart={() => setIsExtracting(true)}
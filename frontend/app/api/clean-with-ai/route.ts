@@ -1,11 +1,11 @@
 import { NextRequest, NextResponse } from 'next/server';
 
 export async function POST(request: NextRequest) {
-    const { extracted_text, user_prompt, ai_provider, user_api_key } = await request.json();
+    const { extracted_text, document_id, page_start, page_end, user_prompt, ai_provider, user_api_key } = await request.json();
     const backendUrl = process.env.BACKEND_URL;
 
 
-    if (!extracted_text || !user_prompt || !ai_provider || !user_api_key) {
+    if (!(extracted_text || document_id) || !user_prompt || !ai_provider || !user_api_key) {
         return NextResponse.json({ error: 'Missing required fields' }, { status: 400 });
     }
 
@@ -13,7 +13,7 @@ export async function POST(request: NextRequest) {
     const response = await fetch(`${backendUrl}/clean-with-ai`, {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({ user_api_key, extracted_text, user_prompt, ai_provider })
+        body: JSON.stringify({ user_api_key, extracted_text, document_id, page_start, page_end, user_prompt, ai_provider })
     });
 
 
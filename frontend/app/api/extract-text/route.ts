@@ -1,13 +1,13 @@
 import { NextRequest, NextResponse } from 'next/server';
 
 export async function POST(request: NextRequest) {
-    const { fileUrl } = await request.json();
+    const { documentId } = await request.json();
     const backendUrl = process.env.BACKEND_URL;
 
     const response = await fetch(`${backendUrl}/extract-text`, {
       method: 'POST',
       headers: { 'Content-Type': 'application/json' },
-      body: JSON.stringify({ fileUrl }),
+      body: JSON.stringify({ document_id: documentId }),
     });
 
     if (!response.ok) {
@@ -15,5 +15,10 @@ export async function POST(request: NextRequest) {
     }
 
     const data = await response.json();
-    return NextResponse.json({ file_url: data.file_url, text: data.text });
+    return NextResponse.json({
+      file_url: data.file_url,
+      text: data.text,
+      document_id: data.document_id,
+      page_count: data.page_count
+    });
 }
@@ -90,7 +90,8 @@ export async function GET(request: NextRequest) {
     }
 
     try {
-        const backendResponse = await fetch(`${backendUrl}/uploaded-file-url`, {
+        const documentId = request.nextUrl.searchParams.get('document_id') || '';
+        const backendResponse = await fetch(`${backendUrl}/uploaded-file-url?document_id=${encodeURIComponent(documentId)}`, {
             method: 'GET',
         });
 
@@ -10,7 +10,7 @@ interface FileUploadStepProps {
   onFileChange: (file: File | null) => void;
   isUploading: boolean;
   onUploadStart: () => void;
-  onUploadComplete: (file: File) => void;
+  onUploadComplete: (file: File, documentId: string) => void;
 }
 
 export default function FileUploadStep({ 
@@ -36,8 +36,14 @@ export default function FileUploadStep({
         throw new Error('Upload failed');
       }
 
+      const result = await response.json();
+      const documentId = result.backendResponse?.document_id;
+      if (!documentId) {
+        throw new Error('Upload response is missing the document id');
+      }
+
       onFileChange(uploadedFile);
-      onUploadComplete(uploadedFile);
+      onUploadComplete(uploadedFile, documentId);
     } catch (error) {
       console.error('Upload error:', error);
       onFileChange(null);
@@ -11,6 +11,7 @@ import toast from 'react-hot-toast';
 
 interface TextExtractionStepProps {
   uploadedFile: File | null;
+  uploadedDocumentId: string;
   extractedText: string | null;
   isExtracting: boolean;
   onExtractionStart: () => void;
@@ -20,6 +21,7 @@ interface TextExtractionStepProps {
 
 export default function TextExtractionStep({
   uploadedFile,
+  uploadedDocumentId,
   extractedText,
   isExtracting,
   onExtractionStart,
@@ -63,7 +65,7 @@ export default function TextExtractionStep({
     );
 
     try {
-      // Update progress: Getting file URL
+      // Update progress: Preparing file
       toast.loading(
         <div className="flex flex-col space-y-2">
           <div className="font-medium">Extracting Text from PDF</div>
@@ -73,25 +75,14 @@ export default function TextExtractionStep({
               style={{ width: '30%' }}
             ></div>
           </div>
-          <div className="text-sm text-gray-600">Getting file URL...</div>
+          <div className="text-sm text-gray-600">Preparing file...</div>
         </div>,
         { id: toastId }
       );
 
-      // Get the uploaded file URL from the backend
-      const fileUrlResponse = await fetch('/api/upload-file', {
-        method: 'GET',
-      });
-
-      if (!fileUrlResponse.ok) {
-        throw new Error('Failed to get file URL');
-      }
-
-      const fileUrlResult = await fileUrlResponse.json();
-      const fileUrl = fileUrlResult.file_url;
-
-      if (!fileUrl) {
-        throw new Error('File URL not found');
+      // The backend stores each upload under its own document id
+      if (!uploadedDocumentId) {
+        throw new Error('Uploaded file not found. Please upload the PDF again.');
       }
 
       // Update progress: Processing PDF
@@ -116,7 +107,7 @@ export default function TextExtractionStep({
           'Content-Type': 'application/json',
         },
         body: JSON.stringify({
-          fileUrl: fileUrl,
+          documentId: uploadedDocumentId,
         }),
       });
 
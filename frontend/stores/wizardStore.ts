@@ -23,6 +23,7 @@ interface WizardState {
   // File and data state
   uploadedFile: File | null;
   persistedFile: PersistedFile | null; // For localStorage persistence
+  uploadedDocumentId: string; // Backend id of the uploaded PDF
   extractedText: string;
   processedData: any[];
   cleanedDataCSV: any[] | null;
@@ -54,6 +55,7 @@ interface WizardState {
   
   // File and data actions
   setUploadedFile: (file: File | null) => void;
+  setUploadedDocumentId: (documentId: string) => void;
   setExtractedText: (text: string) => void;
   setProcessedData: (data: any[], userColumnOrder?: string[]) => void;
   updateColumnOrder: (newOrder: string[]) => void;
@@ -101,6 +103,7 @@ const initialState = {
   // File and data state
   uploadedFile: null,
   persistedFile: null,
+  uploadedDocumentId: '',
   extractedText: '',
   processedData: [],
   cleanedDataCSV: null,
@@ -172,6 +175,8 @@ export const useWizardStore = create<WizardState>()(
         }
       },
       
+      setUploadedDocumentId: (documentId: string) => set({ uploadedDocumentId: documentId }),
+      
       setExtractedText: (text: string) => set({ extractedText: text }),
       
       setProcessedData: (data: any[], userColumnOrder?: string[]) => {
@@ -313,6 +318,7 @@ export const useWizardStore = create<WizardState>()(
         currentStep: state.currentStep,
         steps: state.steps,
         persistedFile: state.persistedFile, // Persist file as base64
+        uploadedDocumentId: state.uploadedDocumentId,
         extractedText: state.extractedText,
         processedData: state.processedData,
         cleanedDataCSV: state.cleanedDataCSV,
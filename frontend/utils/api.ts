@@ -69,10 +69,10 @@ export const uploadFile = async (file: File, endpoint: string = '/api/upload-fil
   }
 };
 
-export const extractText = async (fileUrl: string): Promise<APIResponse<{ text: string }>> => {
+export const extractText = async (documentId: string): Promise<APIResponse<{ text: string }>> => {
   return apiCall('/api/extract-text', {
     method: 'POST',
-    body: JSON.stringify({ fileUrl }),
+    body: JSON.stringify({ documentId }),
   });
 };
 